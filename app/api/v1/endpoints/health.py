@@ -2,6 +2,7 @@
 API endpoint for health checks.
 """
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -11,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.dependencies import get_cache_service
 from app.db.session import get_async_session
 from app.services.cache import CacheService
+from app.utils.constants import CELERY_INSPECT_TIMEOUT_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -47,8 +49,11 @@ async def health_check(
     try:
         from app.workers.celery_app import celery_app
 
-        # Check Celery broker connection (Redis)
-        broker_info = celery_app.control.inspect().stats()
+        # Check Celery broker connection (Redis). The inspect call is a blocking
+        # broker round-trip, so run it off the event loop.
+        broker_info = await asyncio.to_thread(
+            lambda: celery_app.control.inspect(timeout=CELERY_INSPECT_TIMEOUT_SECONDS).stats()
+        )
         if broker_info:
             dependencies["celery_broker"] = "ok"
 
@@ -357,7 +357,7 @@ def get_config_path() -> Path:
     return config_file
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get application settings with caching.
@@ -3,7 +3,7 @@
 import hashlib
 import logging
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime
 from typing import Any
 
@@ -16,6 +16,7 @@ from app.schemas.graph import (
     FollowsRelationship,
     GraphRelationship,
     MentionsRelationship,
+    NodeType,
     RelationshipType,
     SpeakerNode,
     SpeaksInRelationship,
@@ -33,7 +34,9 @@ class GraphProcessor:
     def __init__(self):
         self.settings = get_settings()
         self.topic_keywords = self._load_topic_keywords()
+        self._topic_keyword_re = self._compile_topic_keywords(self.topic_keywords)
         self.entity_patterns = self._load_entity_patterns()
+        self._compiled_entity_patterns = self._compile_entity_patterns(self.entity_patterns)
 
         # Initialize LLM processors if configured
         self._init_llm_processors()
@@ -128,6 +131,25 @@ class GraphProcessor:
             "mention": r"@[a-zA-Z0-9_]+",
         }
 
+    @staticmethod
+    def _compile_topic_keywords(topic_keywords: dict[str, list[str]]) -> re.Pattern[str] | None:
+        """Compile all topic keywords into one alternation used to skip non-matching text."""
+        keywords = {keyword for words in topic_keywords.values() for keyword in words}
+        if not keywords:
+            return None
+        return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+    @staticmethod
+    def _compile_entity_patterns(patterns: dict[str, str]) -> list[tuple[str, re.Pattern[str]]]:
+        """Compile entity patterns once, skipping any that are invalid."""
+        compiled = []
+        for entity_type, pattern in patterns.items():
+            try:
+                compiled.append((entity_type.upper(), re.compile(pattern, re.IGNORECASE)))
+            except re.error as e:
+                logger.warning(f"Invalid regex pattern for {entity_type}: {e}")
+        return compiled
+
     async def process_transcription_result(
         self, transcription_data: dict[str, Any]
     ) -> dict[str, Any]:
@@ -200,11 +222,17 @@ class GraphProcessor:
         topics = {}
         entities = {}
         transcript_segments = {}
+        # Per-segment extraction results, reused when creating relationships
+        segment_extractions = {}
 
         # Track statistics
         total_duration = 0
-        speaker_stats = defaultdict(lambda: {"time": 0, "turns": 0})
+        speaker_time: defaultdict[str, float] = defaultdict(float)
+        speaker_turns: defaultdict[str, int] = defaultdict(int)
         topic_mentions = defaultdict(int)
+        analyze_sentiment = bool(
+            self.settings.graph.sentiment_analysis_enabled and self.llm_sentiment_analyzer
+        )
 
         # Process each segment
         for i, segment in enumerate(segments):
@@ -238,11 +266,11 @@ class GraphProcessor:
                 )
 
             # Update speaker statistics
-            speaker_stats[speaker_id]["time"] += duration
-            speaker_stats[speaker_id]["turns"] += 1
+            speaker_time[speaker_id] += duration
+            speaker_turns[speaker_id] += 1
 
             # Add sentiment analysis if enabled
-            if self.settings.graph.sentiment_analysis_enabled and self.llm_sentiment_analyzer:
+            if analyze_sentiment:
                 try:
                     logger.debug(f"Analyzing sentiment for segment: {text[:50]}...")
                     sentiment_data = await self.llm_sentiment_analyzer.analyze_sentiment(text)
@@ -277,6 +305,7 @@ class GraphProcessor:
 
             # Extract entities from text
             segment_entities = await self._extract_entities(text)
+            segment_extractions[segment_id] = (segment_topics, segment_entities)
             for entity_text, entity_type, confidence_score in segment_entities:
                 entity_id = self._generate_entity_id(entity_text, entity_type)
                 if entity_id not in entities:
@@ -307,13 +336,13 @@ class GraphProcessor:
         )
 
         # Update speaker statistics
-        for speaker_id, stats in speaker_stats.items():
+        for speaker_id, speaking_time in speaker_time.items():
             speakers[speaker_id].properties.update(
                 {
-                    "total_speaking_time": stats["time"],
-                    "turn_count": stats["turns"],
+                    "total_speaking_time": speaking_time,
+                    "turn_count": speaker_turns[speaker_id],
                     "participation_ratio": (
-                        stats["time"] / total_duration if total_duration > 0 else 0
+                        speaking_time / total_duration if total_duration > 0 else 0
                     ),
                 }
             )
@@ -328,7 +357,7 @@ class GraphProcessor:
             "topics": topics,
             "entities": entities,
             "transcript_segments": transcript_segments,
-            "segments_data": segments,  # Keep original for relationship creation
+            "segment_extractions": segment_extractions,
         }
 
     async def _extract_topics(self, text: str) -> list[tuple[str, float]]:
@@ -383,6 +412,10 @@ class GraphProcessor:
         text_lower = text.lower()
         topics = []
 
+        # Most segments mention no keyword at all; one scan rules them out
+        if self._topic_keyword_re is None or not self._topic_keyword_re.search(text_lower):
+            return topics
+
         for topic_name, keywords in self.topic_keywords.items():
             matches = sum(1 for keyword in keywords if keyword in text_lower)
             if matches > 0:
@@ -437,16 +470,11 @@ class GraphProcessor:
         """Extract entities from text using pattern matching (original method)."""
         entities = []
 
-        for entity_type, pattern in self.entity_patterns.items():
-            try:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    # Simple confidence based on pattern match
-                    confidence = 0.8 if len(match) > 5 else 0.6
-                    entities.append((match, entity_type.upper(), confidence))
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern for {entity_type}: {e}")
-                continue
+        for entity_type, pattern in self._compiled_entity_patterns:
+            for match in pattern.findall(text):
+                # Simple confidence based on pattern match
+                confidence = 0.8 if len(match) > 5 else 0.6
+                entities.append((match, entity_type, confidence))
 
         return entities
 
@@ -549,7 +577,7 @@ class GraphProcessor:
         topics = graph_data["topics"]
         entities = graph_data["entities"]
         transcript_segments = graph_data["transcript_segments"]
-        graph_data["segments_data"]
+        segment_extractions = graph_data["segment_extractions"]
 
         # Speaker -> Conversation relationships
         for speaker_id, speaker_node in speakers.items():
@@ -562,6 +590,10 @@ class GraphProcessor:
                 )
             )
 
+        # Speaker -> Topic mentions, aggregated so each pair is written once
+        discussion_counts: Counter[tuple[str, str]] = Counter()
+        discussion_relevance: dict[tuple[str, str], float] = {}
+
         # Process each segment for detailed relationships
         segment_list = list(transcript_segments.values())
         for i, segment in enumerate(segment_list):
@@ -577,6 +609,8 @@ class GraphProcessor:
                     relationship_type=RelationshipType.CONTAINS,
                     properties={},
                     created_at=datetime.utcnow(),
+                    from_node_type=NodeType.CONVERSATION,
+                    to_node_type=NodeType.TRANSCRIPT_SEGMENT,
                 )
             )
 
@@ -597,23 +631,19 @@ class GraphProcessor:
                     )
                 )
 
+            # Topics and entities were already extracted while building the nodes
+            segment_topics, segment_entities = segment_extractions[segment_id]
+
             # Topic relationships
-            segment_topics = await self._extract_topics(text)
             for topic_name, confidence in segment_topics:
                 topic_id = self._generate_topic_id(topic_name)
                 if topic_id in topics:
                     # Speaker discusses topic
-                    relationships.append(
-                        DiscussesRelationship(
-                            speaker_id=speaker_id,
-                            topic_id=topic_id,
-                            mention_count=1,
-                            context_relevance=confidence,
-                        )
-                    )
+                    key = (speaker_id, topic_id)
+                    discussion_counts[key] += 1
+                    discussion_relevance[key] = max(discussion_relevance.get(key, 0.0), confidence)
 
             # Entity relationships
-            segment_entities = await self._extract_entities(text)
             for entity_text, entity_type, confidence in segment_entities:
                 entity_id = self._generate_entity_id(entity_text, entity_type)
                 if entity_id in entities:
@@ -628,6 +658,16 @@ class GraphProcessor:
                         )
                     )
 
+        for (speaker_id, topic_id), mention_count in discussion_counts.items():
+            relationships.append(
+                DiscussesRelationship(
+                    speaker_id=speaker_id,
+                    topic_id=topic_id,
+                    mention_count=mention_count,
+                    context_relevance=discussion_relevance[(speaker_id, topic_id)],
+                )
+            )
+
         return relationships
 
 
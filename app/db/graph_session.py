@@ -1,7 +1,9 @@
 """Graph database session manager with database-agnostic interface."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -33,6 +35,17 @@ class GraphDatabaseDriver(ABC):
     ) -> list[dict]:
         """Execute write query and return results."""
 
+    async def stream_read_query(
+        self, query: str, parameters: dict[str, Any] | None = None
+    ) -> AsyncIterator[dict]:
+        """Execute read query and yield results one at a time."""
+        for record in await self.execute_read_query(query, parameters):
+            yield record
+
+    async def execute_read_queries(self, queries: list[tuple]) -> list[list[dict]]:
+        """Execute several read queries and return the records of each."""
+        return [await self.execute_read_query(query, parameters) for query, parameters in queries]
+
     @abstractmethod
     async def execute_batch_queries(self, queries: list[tuple]) -> list[dict]:
         """Execute multiple queries in batch."""
@@ -41,10 +54,21 @@ class GraphDatabaseDriver(ABC):
 class Neo4jDriver(GraphDatabaseDriver):
     """Neo4j implementation of graph database driver."""
 
-    def __init__(self, url: str, username: str, password: str):
+    def __init__(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        max_connection_lifetime: int = 1800,
+        max_connection_pool_size: int = 50,
+        connection_acquisition_timeout: int = 30,
+    ):
         self.url = url
         self.username = username
         self.password = password
+        self.max_connection_lifetime = max_connection_lifetime
+        self.max_connection_pool_size = max_connection_pool_size
+        self.connection_acquisition_timeout = connection_acquisition_timeout
         self._driver = None
 
     async def connect(self) -> None:
@@ -52,7 +76,13 @@ class Neo4jDriver(GraphDatabaseDriver):
         try:
             from neo4j import AsyncGraphDatabase
 
-            self._driver = AsyncGraphDatabase.driver(self.url, auth=(self.username, self.password))
+            self._driver = AsyncGraphDatabase.driver(
+                self.url,
+                auth=(self.username, self.password),
+                max_connection_lifetime=self.max_connection_lifetime,
+                max_connection_pool_size=self.max_connection_pool_size,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
+            )
             logger.info(f"Connected to Neo4j at {self.url}")
         except Exception as e:
             logger.error(f"Failed to connect to Neo4j: {e}")
@@ -64,20 +94,51 @@ class Neo4jDriver(GraphDatabaseDriver):
             await self._driver.close()
             logger.info("Disconnected from Neo4j")
 
+    @staticmethod
+    async def _collect_records(tx, query: str, parameters: dict[str, Any]) -> list[dict]:
+        """Run a query inside a transaction and collect its records."""
+        result = await tx.run(query, parameters)
+        return [dict(record) async for record in result]
+
     async def execute_read_query(
         self, query: str, parameters: dict[str, Any] | None = None
     ) -> list[dict]:
         """Execute read query in Neo4j."""
         parameters = parameters or {}
 
+        if self._driver is None:
+            raise RuntimeError("Neo4j driver not initialized.")
+        # Managed transactions retry transient errors with backoff and fail fast otherwise
+        async with self._driver.session() as session:
+            return await session.execute_read(self._collect_records, query, parameters)
+
+    async def execute_read_queries(self, queries: list[tuple]) -> list[list[dict]]:
+        """Execute several read queries in one Neo4j session and transaction."""
+        if self._driver is None:
+            raise RuntimeError("Neo4j driver not initialized.")
+
+        async def _run_reads(tx) -> list[list[dict]]:
+            return [
+                await self._collect_records(tx, query, parameters or {})
+                for query, parameters in queries
+            ]
+
+        # One session handshake and transaction setup for every query
+        async with self._driver.session() as session:
+            return await session.execute_read(_run_reads)
+
+    async def stream_read_query(
+        self, query: str, parameters: dict[str, Any] | None = None
+    ) -> AsyncIterator[dict]:
+        """Stream read query results from Neo4j as they arrive."""
+        parameters = parameters or {}
+
         if self._driver is None:
             raise RuntimeError("Neo4j driver not initialized.")
         async with self._driver.session() as session:
             result = await session.run(query, parameters)  # type: ignore[arg-type]
-            records = []
             async for record in result:
-                records.append(dict(record))
-            return records
+                yield dict(record)
 
     async def execute_write_query(
         self, query: str, parameters: dict[str, Any] | None = None
@@ -88,37 +149,35 @@ class Neo4jDriver(GraphDatabaseDriver):
         if self._driver is None:
             raise RuntimeError("Neo4j driver not initialized.")
         async with self._driver.session() as session:
-            result = await session.run(query, parameters)  # type: ignore[arg-type]
-            records = []
-            async for record in result:
-                records.append(dict(record))
-            return records
+            return await session.execute_write(self._collect_records, query, parameters)
 
     async def execute_batch_queries(self, queries: list[tuple]) -> list[dict]:
         """Execute multiple queries in batch in Neo4j."""
-        results = []
-
         if self._driver is None:
             raise RuntimeError("Neo4j driver not initialized.")
 
         logger.info(f"🔄 Neo4j executing {len(queries)} batch queries...")
 
-        async with self._driver.session() as session:
+        async def _run_batch(tx) -> list[dict]:
+            # Rebuilt from scratch if the driver retries the transaction
+            results = []
             for i, (query, parameters) in enumerate(queries):
                 try:
                     logger.debug(f"📤 Executing query {i + 1}: {query[:100]}...")
-                    result = await session.run(query, parameters or {})
-                    batch_records = []
-                    async for record in result:
-                        batch_records.append(dict(record))
+                    batch_records = await self._collect_records(tx, query, parameters or {})
                     results.extend(batch_records)
                     logger.debug(f"✅ Query {i + 1} completed: {len(batch_records)} records")
                 except Exception as e:
                     logger.error(f"❌ Query {i + 1} failed: {e}")
                     logger.error(f"   Query: {query}")
                     logger.error(f"   Parameters: {parameters}")
-                    # Continue with other queries instead of failing completely
-                    continue
+                    raise
+            return results
+
+        # One managed transaction commits the whole batch at once and is retried
+        # on transient errors; any other failure rolls the batch back
+        async with self._driver.session() as session:
+            results = await session.execute_write(_run_batch)
 
         logger.info(f"✅ Neo4j batch execution completed: {len(results)} total results")
         return results
@@ -231,23 +290,33 @@ class GraphDatabaseManager:
         self._settings = get_settings()
         self._driver: GraphDatabaseDriver | None = None
         self._is_connected = False
+        self._init_lock = asyncio.Lock()
 
     async def initialize(self) -> None:
-        """Initialize graph database connection."""
+        """Initialize graph database connection.
+
+        Idempotent: the driver (and its connection pool) is created once per
+        process and reused by every caller that finds the manager disconnected.
+        """
         if not self._settings.graph.enabled:
             logger.info("Graph database is disabled")
             return
 
-        try:
-            # Factory pattern for database drivers
-            self._driver = self._create_driver()
-            await self._driver.connect()
-            self._is_connected = True
-            logger.info("Graph database initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize graph database: {e}")
-            self._is_connected = False
-            raise
+        async with self._init_lock:
+            # Another caller may have connected while we waited for the lock
+            if self._is_connected:
+                return
+
+            try:
+                # Factory pattern for database drivers
+                self._driver = self._create_driver()
+                await self._driver.connect()
+                self._is_connected = True
+                logger.info("Graph database initialized successfully")
+            except Exception as e:
+                logger.error(f"Failed to initialize graph database: {e}")
+                self._is_connected = False
+                raise
 
     def _create_driver(self) -> GraphDatabaseDriver:
         """Create appropriate driver based on configuration."""
@@ -258,6 +327,11 @@ class GraphDatabaseManager:
                 url=self._settings.graph.database.url,
                 username=self._settings.graph.database.username,
                 password=self._settings.graph.database.password,
+                max_connection_lifetime=self._settings.graph.database.max_connection_lifetime,
+                max_connection_pool_size=self._settings.graph.database.max_connection_pool_size,
+                connection_acquisition_timeout=(
+                    self._settings.graph.database.connection_acquisition_timeout
+                ),
             )
         elif db_type == "arangodb":
             return ArangoDBDriver(
@@ -302,6 +376,33 @@ class GraphDatabaseManager:
             logger.error(f"Failed to execute read transaction: {e}")
             return []
 
+    async def execute_read_transactions(self, queries: list[tuple]) -> list[list[dict]]:
+        """Execute several read queries together and return the records of each."""
+        if not self.is_enabled or not self.is_connected:
+            logger.debug("Graph database not available")
+            return [[] for _ in queries]
+
+        try:
+            if self._driver is None:
+                raise RuntimeError("Graph database driver not initialized.")
+            return await self._driver.execute_read_queries(queries)
+        except Exception as e:
+            logger.error(f"Failed to execute read transactions: {e}")
+            return [[] for _ in queries]
+
+    async def stream_read_transaction(
+        self, query: str, parameters: dict[str, Any] | None = None
+    ) -> AsyncIterator[dict]:
+        """Stream read transaction results without materializing them."""
+        if not self.is_enabled or not self.is_connected:
+            logger.debug("Graph database not available")
+            return
+
+        if self._driver is None:
+            raise RuntimeError("Graph database driver not initialized.")
+        async for record in self._driver.stream_read_query(query, parameters or {}):
+            yield record
+
     async def execute_write_transaction(
         self, query: str, parameters: dict[str, Any] | None = None
     ) -> list[dict]:
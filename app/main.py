@@ -64,9 +64,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize graph database connection
     try:
         from app.db.graph_session import graph_db_manager
+        from app.services.graph_service import get_graph_service
 
         if settings.graph.enabled:
             await graph_db_manager.initialize()
+            await get_graph_service().ensure_indexes()
             logger.info("Graph database connection established")
         else:
             logger.info("Graph processing is disabled")
@@ -203,6 +203,9 @@ class GraphRelationship:
     relationship_type: RelationshipType
     properties: dict[str, Any]
     created_at: datetime
+    # Endpoint labels let batch writes match nodes through their id indexes
+    from_node_type: NodeType | None = None
+    to_node_type: NodeType | None = None
 
     def to_cypher_props(self) -> dict[str, Any]:
         """Convert to Cypher-compatible properties."""
@@ -244,6 +247,8 @@ class SpeaksInRelationship(GraphRelationship):
             from_node_id=speaker_id,
             to_node_id=conversation_id,
             relationship_type=RelationshipType.SPEAKS_IN,
+            from_node_type=NodeType.SPEAKER,
+            to_node_type=NodeType.CONVERSATION,
             properties={
                 "speaking_time": speaking_time,
                 "turn_count": turn_count,
@@ -268,6 +273,8 @@ class DiscussesRelationship(GraphRelationship):
             from_node_id=speaker_id,
             to_node_id=topic_id,
             relationship_type=RelationshipType.DISCUSSES,
+            from_node_type=NodeType.SPEAKER,
+            to_node_type=NodeType.TOPIC,
             properties={
                 "mention_count": mention_count,
                 "context_relevance": context_relevance,
@@ -292,6 +299,8 @@ class MentionsRelationship(GraphRelationship):
             from_node_id=segment_id,
             to_node_id=entity_id,
             relationship_type=RelationshipType.MENTIONS,
+            from_node_type=NodeType.TRANSCRIPT_SEGMENT,
+            to_node_type=NodeType.ENTITY,
             properties={
                 "mention_position": mention_position,
                 "confidence_score": confidence_score,
@@ -316,6 +325,8 @@ class FollowsRelationship(GraphRelationship):
             from_node_id=from_segment_id,
             to_node_id=to_segment_id,
             relationship_type=RelationshipType.FOLLOWS,
+            from_node_type=NodeType.TRANSCRIPT_SEGMENT,
+            to_node_type=NodeType.TRANSCRIPT_SEGMENT,
             properties={
                 "time_gap": time_gap,
                 "speaker_change": speaker_change,
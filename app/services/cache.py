@@ -5,6 +5,7 @@ Redis caching service.
 import logging
 from typing import Any
 
+import msgpack
 import redis.asyncio as redis
 
 from app.config.settings import get_settings
@@ -13,6 +14,16 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def _pack(value: Any) -> bytes:
+    """Serialize a cache value with MessagePack."""
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def _unpack(raw: bytes) -> Any:
+    """Deserialize a MessagePack cache value."""
+    return msgpack.unpackb(raw, raw=False)
+
+
 class CacheService:
     """
     Service for interacting with Redis cache.
@@ -33,7 +44,8 @@ class CacheService:
         """
 
         try:
-            return await self.redis_client.get(key)
+            raw = await self.redis_client.get(key)
+            return None if raw is None else _unpack(raw)
         except Exception as e:
             logger.error(f"Failed to get key {key} from cache: {e}", exc_info=True)
             return None
@@ -49,10 +61,27 @@ class CacheService:
         """
 
         try:
-            await self.redis_client.set(key, value, ex=expire)
+            await self.redis_client.set(key, _pack(value), ex=expire)
         except Exception as e:
             logger.error(f"Failed to set key {key} in cache: {e}", exc_info=True)
 
+    async def set_many(self, mapping: dict[str, Any], expire: int = 3600) -> None:
+        """
+        Set several values in the cache in a single round trip.
+
+        Args:
+            mapping: The keys and values to set.
+            expire: The expiration time in seconds, applied to every key.
+        """
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.set(key, _pack(value), ex=expire)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to set {len(mapping)} keys in cache: {e}", exc_info=True)
+
     async def delete(self, key: str) -> None:
         """
         Delete a key from the cache.
@@ -2,14 +2,106 @@
 Graph service for abstracting graph database operations.
 """
 
+import asyncio
 import logging
+from collections import defaultdict
 from typing import Any
 
 from app.config.settings import get_settings
 from app.db.graph_session import get_graph_db_manager
+from app.schemas.graph import NodeType
 
 logger = logging.getLogger(__name__)
 
+# Static Cypher queries are kept at module scope so every call sends identical
+# query text, which lets Neo4j reuse its cached execution plans.
+_DATABASE_STATS_QUERY = """
+CALL { MATCH (n) RETURN count(n) as nodes }
+CALL { MATCH ()-[r]->() RETURN count(r) as relationships }
+RETURN nodes, relationships
+"""
+
+_CONVERSATION_GRAPH_QUERY = """
+MATCH (conv:Conversation {id: $conversation_id})
+OPTIONAL MATCH (conv)-[:HAS_SPEAKER]->(s:Speaker)
+OPTIONAL MATCH (conv)-[:HAS_TOPIC]->(t:Topic)
+OPTIONAL MATCH (s)-[r:SPEAKS_TO]->(s2:Speaker)
+RETURN conv, collect(DISTINCT s) as speakers,collect(DISTINCT t) as topics,
+       collect(DISTINCT r) as relationships
+"""
+
+_SPEAKER_NETWORK_QUERY = """
+MATCH (conv:Conversation {id: $conversation_id})-[:HAS_SPEAKER]->(s1:Speaker)
+OPTIONAL MATCH (s1)-[r:SPEAKS_TO]->(s2:Speaker)
+              <-[:HAS_SPEAKER]-(conv)
+RETURN s1.id as speaker_id, s1.name as speaker_name,
+       s1.speaking_time as speaking_time,
+       collect({
+           target_id: s2.id,
+           target_name: s2.name,
+           interaction_count: r.interaction_count,
+           total_duration: r.total_duration
+       }) as interactions
+ORDER BY s1.speaking_time DESC
+"""
+
+_TOPIC_FLOW_QUERY = """
+MATCH (conv:Conversation {id: $conversation_id})-[:HAS_TOPIC]->(t:Topic)
+OPTIONAL MATCH (t)-[r:TRANSITIONS_TO]->(t2:Topic)<-[:HAS_TOPIC]-(conv)
+RETURN t.id as topic_id, t.name as topic_name,
+       t.start_time as start_time, t.end_time as end_time,
+       t.duration as duration, t.keywords as keywords,
+       collect({
+           target_id: t2.id,
+           target_name: t2.name,
+           transition_time: r.transition_time,
+           transition_type: r.transition_type
+       }) as transitions
+ORDER BY t.start_time ASC
+"""
+
+# One query per direction; relationship types are passed as a parameter
+_NODE_RELATIONSHIPS_QUERIES = {
+    direction: f"""
+MATCH (n {{id: $node_id}}){pattern}(related)
+WHERE $relationship_types IS NULL OR type(r) IN $relationship_types
+RETURN n, r, related, type(r) as rel_type
+"""
+    for direction, pattern in (
+        ("OUTGOING", "-[r]->"),
+        ("INCOMING", "<-[r]-"),
+        ("BOTH", "-[r]-"),
+    )
+}
+
+# Every node label is MERGEd and looked up by id
+_INDEX_QUERIES = [
+    f"CREATE INDEX {node_type.value.lower()}_id IF NOT EXISTS FOR (n:{node_type.value}) ON (n.id)"
+    for node_type in NodeType
+]
+
+_SHORTEST_PATH_QUERY = """
+MATCH (start {id: $from_node_id}), (end {id: $to_node_id})
+MATCH p = shortestPath((start)-[*1..$max_hops]-(end))
+RETURN nodes(p) as path_nodes, relationships(p) as path_relationships,
+       length(p) as path_length
+"""
+
+
+def _label_pattern(node_type: NodeType | None) -> str:
+    """Cypher label suffix for a relationship endpoint, empty when the label is unknown."""
+    return f":{node_type.value}" if node_type is not None else ""
+
+
+def _chunk_columns(columns: dict[str, list[Any]], size: int) -> list[dict[str, list[Any]]]:
+    """Split parallel UNWIND parameter arrays into chunks of at most ``size`` entries."""
+    size = max(size, 1)
+    total = len(next(iter(columns.values()), []))
+    return [
+        {name: values[start : start + size] for name, values in columns.items()}
+        for start in range(0, total, size)
+    ]
+
 
 class GraphService:
     """
@@ -19,6 +111,28 @@ class GraphService:
     def __init__(self):
         self.settings = get_settings()
 
+    async def ensure_indexes(self) -> None:
+        """
+        Create the node id indexes used by MERGE and lookups if they are missing.
+
+        Safe to call on every startup; existing indexes are left untouched.
+        """
+        if not self.settings.graph.enabled:
+            return
+
+        if self.settings.graph.database.type.lower() != "neo4j":
+            logger.debug("Index creation is only implemented for Neo4j")
+            return
+
+        manager = await get_graph_db_manager()
+        if not manager.is_connected:
+            await manager.initialize()
+
+        for query in _INDEX_QUERIES:
+            await manager.execute_write_transaction(query)
+
+        logger.info(f"Ensured {len(_INDEX_QUERIES)} graph node indexes")
+
     async def get_database_stats(self) -> dict[str, Any]:
         """
         Get statistics about the graph database.
@@ -38,16 +152,13 @@ class GraphService:
             if not manager.is_connected:
                 await manager.initialize()
 
-            # Query actual database stats
-            node_count_query = "MATCH (n) RETURN count(n) as nodes"
-            rel_count_query = "MATCH ()-[r]->() RETURN count(r) as relationships"
-
-            node_result = await manager.execute_read_transaction(node_count_query)
-            rel_result = await manager.execute_read_transaction(rel_count_query)
+            # Query actual database stats in a single round trip
+            result = await manager.execute_read_transaction(_DATABASE_STATS_QUERY)
+            stats = result[0] if result else {}
 
             return {
-                "nodes": node_result[0]["nodes"] if node_result else 0,
-                "relationships": rel_result[0]["relationships"] if rel_result else 0,
+                "nodes": stats.get("nodes", 0),
+                "relationships": stats.get("relationships", 0),
                 "database_type": self.settings.graph.database.type,
                 "enabled": True,
             }
@@ -78,17 +189,8 @@ class GraphService:
                 await manager.initialize()
 
             # Query for conversation nodes and relationships
-            query = """
-            MATCH (conv:Conversation {id: $conversation_id})
-            OPTIONAL MATCH (conv)-[:HAS_SPEAKER]->(s:Speaker)
-            OPTIONAL MATCH (conv)-[:HAS_TOPIC]->(t:Topic)
-            OPTIONAL MATCH (s)-[r:SPEAKS_TO]->(s2:Speaker)
-            RETURN conv, collect(DISTINCT s) as speakers,collect(DISTINCT t) as topics,
-                   collect(DISTINCT r) as relationships
-            """
-
             result = await manager.execute_read_transaction(
-                query, {"conversation_id": conversation_id}
+                _CONVERSATION_GRAPH_QUERY, {"conversation_id": conversation_id}
             )
 
             if not result:
@@ -162,28 +264,11 @@ class GraphService:
             if not manager.is_connected:
                 await manager.initialize()
 
-            # Query for speaker interactions
-            query = """
-            MATCH (conv:Conversation {id: $conversation_id})-[:HAS_SPEAKER]->(s1:Speaker)
-            OPTIONAL MATCH (s1)-[r:SPEAKS_TO]->(s2:Speaker)
-                          <-[:HAS_SPEAKER]-(conv)
-            RETURN s1.id as speaker_id, s1.name as speaker_name,
-                   s1.speaking_time as speaking_time,
-                   collect({
-                       target_id: s2.id,
-                       target_name: s2.name,
-                       interaction_count: r.interaction_count,
-                       total_duration: r.total_duration
-                   }) as interactions
-            ORDER BY s1.speaking_time DESC
-            """
-
-            results = await manager.execute_read_transaction(
-                query, {"conversation_id": conversation_id}
-            )
-
+            # Stream speaker interactions instead of materializing the raw records
             network = []
-            for result in results:
+            async for result in manager.stream_read_transaction(
+                _SPEAKER_NETWORK_QUERY, {"conversation_id": conversation_id}
+            ):
                 # Filter out null interactions
                 interactions = [i for i in result.get("interactions", []) if i.get("target_id")]
 
@@ -216,23 +301,8 @@ class GraphService:
                 await manager.initialize()
 
             # Query for topic transitions and timeline
-            query = """
-            MATCH (conv:Conversation {id: $conversation_id})-[:HAS_TOPIC]->(t:Topic)
-            OPTIONAL MATCH (t)-[r:TRANSITIONS_TO]->(t2:Topic)<-[:HAS_TOPIC]-(conv)
-            RETURN t.id as topic_id, t.name as topic_name,
-                   t.start_time as start_time, t.end_time as end_time,
-                   t.duration as duration, t.keywords as keywords,
-                   collect({
-                       target_id: t2.id,
-                       target_name: t2.name,
-                       transition_time: r.transition_time,
-                       transition_type: r.transition_type
-                   }) as transitions
-            ORDER BY t.start_time ASC
-            """
-
             results = await manager.execute_read_transaction(
-                query, {"conversation_id": conversation_id}
+                _TOPIC_FLOW_QUERY, {"conversation_id": conversation_id}
             )
 
             topic_flow = []
@@ -276,22 +346,15 @@ class GraphService:
             if not manager.is_connected:
                 await manager.initialize()
 
-            # Build query based on direction and relationship types
-            direction_clause = ""
-            if direction.upper() == "OUTGOING":
-                direction_clause = "-[r]->"
-            elif direction.upper() == "INCOMING":
-                direction_clause = "<-[r]-"
-            else:  # BOTH
-                direction_clause = "-[r]-"
-
-            query = f"""
-            MATCH (n {{id: $node_id}}){direction_clause}(related)
-            WHERE type(r) {f"IN {relationship_types}" if relationship_types else "IS NOT NULL"}
-            RETURN n, r, related, type(r) as rel_type
-            """
+            # Pick the query for the direction; anything else matches both ways
+            query = _NODE_RELATIONSHIPS_QUERIES.get(
+                direction.upper(), _NODE_RELATIONSHIPS_QUERIES["BOTH"]
+            )
 
-            results = await manager.execute_read_transaction(query, {"node_id": node_id})
+            results = await manager.execute_read_transaction(
+                query,
+                {"node_id": node_id, "relationship_types": relationship_types or None},
+            )
 
             relationships = []
             for result in results:
@@ -344,15 +407,8 @@ class GraphService:
                 await manager.initialize()
 
             # Use Cypher shortestPath function with max hop limit
-            query = """
-            MATCH (start {id: $from_node_id}), (end {id: $to_node_id})
-            MATCH p = shortestPath((start)-[*1..$max_hops]-(end))
-            RETURN nodes(p) as path_nodes, relationships(p) as path_relationships,
-                   length(p) as path_length
-            """
-
             results = await manager.execute_read_transaction(
-                query,
+                _SHORTEST_PATH_QUERY,
                 {
                     "from_node_id": from_node_id,
                     "to_node_id": to_node_id,
@@ -413,18 +469,41 @@ class GraphService:
                 logger.info("📡 Initializing graph database connection...")
                 await manager.initialize()
 
-            queries = []
-            for i, node in enumerate(nodes):
-                props = node.to_cypher_props()
-                query = f"MERGE (n:{node.node_type.value} {{id: $id}}) ON CREATE SET n = $props ON MATCH SET n += $props"
-                queries.append((query, {"id": node.id, "props": props}))
-
-                if i < 3:  # Log first 3 queries for debugging
-                    logger.info(f"📋 Query {i + 1}: {query}")
-                    logger.info(f"📋 Props {i + 1}: {props}")
-
-            logger.info(f"📤 Executing {len(queries)} node creation queries...")
-            results = await manager.execute_batch_transactions(queries)
+            # Group nodes by label so each label is written with UNWIND batches
+            # instead of one MERGE statement per node. Ids and properties travel
+            # as parallel arrays rather than one map per node.
+            columns_by_label: dict[str, dict[str, list[Any]]] = defaultdict(
+                lambda: {"ids": [], "props": []}
+            )
+            for node in nodes:
+                columns = columns_by_label[node.node_type.value]
+                columns["ids"].append(node.id)
+                columns["props"].append(node.to_cypher_props())
+
+            batch_size = self.settings.graph.processing_batch_size
+            queries_by_label: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+            for label, columns in columns_by_label.items():
+                query = (
+                    "UNWIND range(0, size($ids) - 1) AS i "
+                    "WITH $ids[i] AS id, $props[i] AS props "
+                    f"MERGE (n:{label} {{id: id}}) "
+                    "ON CREATE SET n = props ON MATCH SET n += props"
+                )
+                queries_by_label[label] = [
+                    (query, chunk) for chunk in _chunk_columns(columns, batch_size)
+                ]
+
+                logger.info(f"📋 {label}: {len(columns['ids'])} nodes, query: {query}")
+
+            # Labels never share nodes, so each label's batch runs concurrently
+            # on its own pooled session instead of waiting for the previous one
+            logger.info(f"📤 Executing node creation for {len(queries_by_label)} labels...")
+            await asyncio.gather(
+                *(
+                    manager.execute_batch_transactions(queries)
+                    for queries in queries_by_label.values()
+                )
+            )
 
             # Return the number of nodes we attempted to create since MERGE doesn't return results
             nodes_created = len(nodes)
@@ -454,22 +533,38 @@ class GraphService:
                 logger.info("📡 Initializing graph database connection...")
                 await manager.initialize()
 
+            # Group relationships by type and endpoint labels so each group is
+            # written with UNWIND batches whose MATCH can use the node id indexes
+            columns_by_group: dict[tuple[str, str, str], dict[str, list[Any]]] = defaultdict(
+                lambda: {"from_ids": [], "to_ids": [], "props": []}
+            )
+            for rel in relationships:
+                key = (
+                    rel.relationship_type.value,
+                    _label_pattern(rel.from_node_type),
+                    _label_pattern(rel.to_node_type),
+                )
+                columns = columns_by_group[key]
+                columns["from_ids"].append(rel.from_node_id)
+                columns["to_ids"].append(rel.to_node_id)
+                columns["props"].append(rel.to_cypher_props())
+
+            batch_size = self.settings.graph.processing_batch_size
             queries = []
-            for i, rel in enumerate(relationships):
+            for (rel_type, from_label, to_label), columns in columns_by_group.items():
                 query = (
-                    f"MATCH (a), (b) WHERE a.id = $from_node_id AND b.id = $to_node_id "
-                    f"MERGE (a)-[r:{rel.relationship_type.value}]->(b) ON CREATE SET r = $props ON MATCH SET r += $props"
+                    "UNWIND range(0, size($from_ids) - 1) AS i "
+                    "WITH $from_ids[i] AS from_id, $to_ids[i] AS to_id, $props[i] AS props "
+                    f"MATCH (a{from_label} {{id: from_id}}), (b{to_label} {{id: to_id}}) "
+                    f"MERGE (a)-[r:{rel_type}]->(b) "
+                    "ON CREATE SET r = props ON MATCH SET r += props"
                 )
-                query_params = {
-                    "from_node_id": rel.from_node_id,
-                    "to_node_id": rel.to_node_id,
-                    "props": rel.to_cypher_props(),
-                }
-                queries.append((query, query_params))
+                for chunk in _chunk_columns(columns, batch_size):
+                    queries.append((query, chunk))
 
-                if i < 3:  # Log first 3 queries for debugging
-                    logger.info(f"🔗 Query {i + 1}: {query}")
-                    logger.info(f"🔗 Params {i + 1}: {query_params}")
+                logger.info(
+                    f"🔗 {rel_type}: {len(columns['from_ids'])} relationships, query: {query}"
+                )
 
             logger.info(f"📤 Executing {len(queries)} relationship creation queries...")
             results = await manager.execute_batch_transactions(queries)
@@ -5,6 +5,7 @@ Summarization service for generating summaries of text.
 import logging
 
 import httpx
+import orjson
 
 from app.config.settings import get_settings
 
@@ -60,9 +61,11 @@ class SummarizationService:
                 connect=settings.summarization.connect_timeout,
             )
             async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(self.api_url, headers=headers, json=payload)
+                response = await client.post(
+                    self.api_url, headers=headers, content=orjson.dumps(payload)
+                )
                 response.raise_for_status()
-                result = response.json()
+                result = orjson.loads(response.content)
                 summary = result["choices"][0]["message"]["content"]
                 return summary
         except httpx.HTTPStatusError as e:
@@ -49,3 +49,6 @@ DEFAULT_UTT_SPLIT = 0.8
 # Celery Queues
 CELERY_DEFAULT_QUEUE = "default"
 CELERY_DLQ_NAME = "dead_letter"
+
+# Health checks
+CELERY_INSPECT_TIMEOUT_SECONDS = 2.0
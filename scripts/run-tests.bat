@@ -57,6 +57,9 @@ if "%TEST_TYPE%"=="all" (
 ) else if "%TEST_TYPE%"=="integration" (
     echo [94mRunning integration tests...[0m
     %PYTEST_CMD% -v tests/integration/
+) else if "%TEST_TYPE%"=="parallel" (
+    echo [94mRunning unit tests in parallel...[0m
+    %PYTEST_CMD% -v tests/unit/ -n auto --dist loadgroup
 ) else if "%TEST_TYPE%"=="coverage" (
     echo [94mRunning tests with coverage...[0m
     %PYTEST_CMD% --cov=app --cov-report=html --cov-report=term-missing -v
@@ -103,6 +103,11 @@ switch ($TestType.ToLower()) {
         $exitCode = Run-Pytest -TestPath "tests/unit/" -AdditionalArgs @("-m", "not slow")
     }
 
+    "parallel" {
+        Write-Host "Running unit tests in parallel..." -ForegroundColor Green
+        $exitCode = Run-Pytest -TestPath "tests/unit/" -AdditionalArgs @("-m", "not slow", "-n", "auto", "--dist", "loadgroup")
+    }
+
     "integration" {
         Write-Host "Running integration tests..." -ForegroundColor Green
         $exitCode = Run-Pytest -TestPath "tests/integration/"
@@ -160,7 +165,7 @@ switch ($TestType.ToLower()) {
 
     default {
         Write-Host "Unknown test type: $TestType" -ForegroundColor Red
-        Write-Host "Available types: unit, integration, e2e, quick, all" -ForegroundColor Yellow
+        Write-Host "Available types: unit, parallel, integration, e2e, quick, all" -ForegroundColor Yellow
         $exitCode = 1
 }
 
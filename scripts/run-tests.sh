@@ -72,6 +72,9 @@ case "$TEST_TYPE" in
     "integration")
         run_test "Running integration tests..." -v tests/integration/
         ;;
+    "parallel")
+        run_test "Running unit tests in parallel..." -v tests/unit/ -n auto --dist loadgroup
+        ;;
     "coverage")
         run_test "Running tests with coverage..." --cov=app --cov-report=html --cov-report=term-missing -v
         # Open coverage report if available and running in WSL with Windows integration
@@ -106,6 +109,7 @@ case "$TEST_TYPE" in
         echo "  all          Run all tests (default)"
         echo "  unit         Run unit tests only"
         echo "  integration  Run integration tests only"
+        echo "  parallel     Run unit tests across pytest-xdist workers"
         echo "  coverage     Run tests with coverage report"
         echo "  fast         Run tests excluding slow ones"
         echo "  env          Run environment configuration tests"
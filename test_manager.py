@@ -41,12 +41,13 @@ def setup_environment():
     return True
 
 
-def run_unit_tests():
-    """Run unit tests."""
+def run_unit_tests(parallel=False):
+    """Run unit tests, optionally spread across pytest-xdist workers."""
     print("Running unit tests...")
-    return run_command(
-        ["uv", "run", "pytest", "tests/unit/", "-v", "--asyncio-mode=auto", "-m", "not slow"]
-    )
+    cmd = ["uv", "run", "pytest", "tests/unit/", "-v", "--asyncio-mode=auto", "-m", "not slow"]
+    if parallel:
+        cmd.extend(["-n", "auto", "--dist", "loadgroup"])
+    return run_command(cmd)
 
 
 def run_integration_tests():
@@ -201,6 +202,11 @@ def main():
         ],
         help="Test command to run",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run unit tests in parallel with pytest-xdist",
+    )
 
     args = parser.parse_args()
 
@@ -208,7 +214,7 @@ def main():
         success = setup_environment()
         sys.exit(0 if success else 1)
     elif args.command == "unit":
-        sys.exit(run_unit_tests())
+        sys.exit(run_unit_tests(parallel=args.parallel))
     elif args.command == "integration":
         sys.exit(run_integration_tests())
     elif args.command == "e2e":
@@ -1,10 +1,22 @@
 """Unit tests for graph service functionality."""
 
+import asyncio
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from neo4j.exceptions import TransientError
 
 from app.core.graph_processor import GraphProcessor
+from app.db.graph_session import GraphDatabaseManager, Neo4jDriver
+from app.schemas.graph import (
+    ConversationNode,
+    GraphRelationship,
+    NodeType,
+    RelationshipType,
+    SpeakerNode,
+    SpeaksInRelationship,
+)
 from app.services.graph_service import GraphService
 
 
@@ -36,7 +48,7 @@ def mock_graph_disabled():
         yield mock_settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_transcription_result():
     """Sample transcription result for testing."""
     return {
@@ -84,6 +96,10 @@ class TestGraphService:
         assert service._enabled is False
         assert service._neo4j_session is None
 
+    def test_graph_services_share_cached_settings(self):
+        """GraphService instances reuse the cached settings object."""
+        assert GraphService().settings is GraphService().settings
+
     @pytest.mark.asyncio
     async def test_create_speaker_node(self, mock_graph_enabled, mock_neo4j_session):
         """Test creating a speaker node."""
@@ -187,9 +203,9 @@ class TestGraphService:
 class TestGraphProcessor:
     """Test cases for GraphProcessor."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def graph_processor(self):
-        """Create GraphProcessor instance."""
+        """Create a GraphProcessor shared by the tests in this module."""
         return GraphProcessor()
 
     def test_extract_speaker_data(self, graph_processor, sample_transcription_result):
@@ -221,6 +237,114 @@ class TestGraphProcessor:
         assert "john@example.com" in entity_values
         assert "555-123-4567" in entity_values
 
+    @pytest.mark.asyncio
+    async def test_extract_graph_data_speaker_statistics(
+        self, graph_processor, sample_transcription_result
+    ):
+        """Test per-speaker time and turn totals in extracted graph data."""
+        segments = sample_transcription_result["segments"] + [
+            {"start": 8.2, "end": 10.0, "text": "Fine.", "speaker": "Speaker_1"}
+        ]
+
+        graph_data = await graph_processor._extract_graph_data(
+            "conv-456", "audio-1", "en", segments
+        )
+
+        john = graph_data["speakers"]["Speaker_1"].properties
+        jane = graph_data["speakers"]["Speaker_2"].properties
+        assert john["total_speaking_time"] == pytest.approx(5.3)
+        assert john["turn_count"] == 2
+        assert jane["total_speaking_time"] == pytest.approx(4.7)
+        assert jane["turn_count"] == 1
+        assert john["participation_ratio"] == pytest.approx(0.53)
+
+    @pytest.mark.asyncio
+    async def test_create_relationships_aggregates_topic_mentions(
+        self, graph_processor
+    ):
+        """Test repeated speaker/topic mentions become one DISCUSSES edge."""
+        topic_name, keywords = next(iter(graph_processor.topic_keywords.items()))
+        segments = [
+            {"start": 0.0, "end": 1.0, "text": keywords[0], "speaker": "A"},
+            {"start": 1.0, "end": 2.0, "text": "Unrelated.", "speaker": "B"},
+            {"start": 2.0, "end": 3.0, "text": keywords[0], "speaker": "A"},
+        ]
+        graph_data = await graph_processor._extract_graph_data(
+            "conv-456", "audio-1", "en", segments
+        )
+
+        relationships = await graph_processor._create_relationships(graph_data)
+
+        discusses = [
+            rel
+            for rel in relationships
+            if rel.relationship_type == RelationshipType.DISCUSSES
+        ]
+        assert len(discusses) == 1
+        assert discusses[0].from_node_id == "A"
+        assert discusses[0].to_node_id == graph_processor._generate_topic_id(topic_name)
+        assert discusses[0].properties["mention_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_create_relationships_reuses_segment_extractions(
+        self, graph_processor, sample_transcription_result
+    ):
+        """Test topics and entities are extracted once per segment."""
+        segments = sample_transcription_result["segments"]
+        with (
+            patch.object(
+                graph_processor,
+                "_extract_topics",
+                wraps=graph_processor._extract_topics,
+            ) as topics,
+            patch.object(
+                graph_processor,
+                "_extract_entities",
+                wraps=graph_processor._extract_entities,
+            ) as entities,
+        ):
+            graph_data = await graph_processor._extract_graph_data(
+                "conv-456", "audio-1", "en", segments
+            )
+            await graph_processor._create_relationships(graph_data)
+
+        assert topics.await_count == len(segments)
+        assert entities.await_count == len(segments)
+
+    def test_extract_entities_regex(self, graph_processor):
+        """Test regex entity extraction with the precompiled patterns."""
+        text = "Contact me at john@example.com or call 555-123-4567"
+        entities = graph_processor._extract_entities_regex(text)
+
+        found = {(value, entity_type) for value, entity_type, _ in entities}
+        assert ("john@example.com", "EMAIL") in found
+        assert ("555-123-4567", "PHONE") in found
+
+    def test_extract_topics_keywords(self, graph_processor, monkeypatch):
+        """Test keyword topic detection, including text with no keywords."""
+        topic_keywords = {"technology": ["ai", "software"], "business": ["budget"]}
+        monkeypatch.setattr(graph_processor, "topic_keywords", topic_keywords)
+        monkeypatch.setattr(
+            graph_processor,
+            "_topic_keyword_re",
+            GraphProcessor._compile_topic_keywords(topic_keywords),
+        )
+
+        topics = dict(
+            graph_processor._extract_topics_keywords("The AI software budget")
+        )
+
+        assert topics == {"technology": 1.0, "business": 1.0}
+        assert graph_processor._extract_topics_keywords("Good morning") == []
+
+    def test_invalid_entity_pattern_is_skipped(self):
+        """Test that invalid patterns are dropped when compiled."""
+        compiled = GraphProcessor._compile_entity_patterns(
+            {"broken": "(", "mention": r"@[a-zA-Z0-9_]+"}
+        )
+
+        assert [entity_type for entity_type, _ in compiled] == ["MENTION"]
+
     def test_extract_speaker_interactions(
         self, graph_processor, sample_transcription_result
     ):
@@ -319,3 +443,380 @@ class TestGraphServiceIntegration:
 
             # Should use batch operation instead of individual calls
             assert mock_neo4j_session.run.call_count == 1  # Single batch operation
+
+
+class TestGraphServiceBatchWrites:
+    """Test that batch writes are grouped into UNWIND statements over parallel arrays."""
+
+    @pytest.fixture
+    def batch_manager(self):
+        """Mock graph database manager that records batch transactions."""
+        manager = MagicMock()
+        manager.is_connected = True
+        manager.execute_batch_transactions = AsyncMock(return_value=[])
+        with patch(
+            "app.services.graph_service.get_graph_db_manager",
+            AsyncMock(return_value=manager),
+        ):
+            yield manager
+
+    @pytest.fixture
+    def batch_service(self, batch_manager):
+        """GraphService with graph enabled and a small batch size."""
+        with patch("app.services.graph_service.get_settings") as mock_settings:
+            mock_settings.return_value.graph.enabled = True
+            mock_settings.return_value.graph.processing_batch_size = 2
+            yield GraphService()
+
+    @pytest.mark.asyncio
+    async def test_create_nodes_batch_uses_unwind_per_label(
+        self, batch_service, batch_manager
+    ):
+        """Nodes are grouped by label and chunked by the processing batch size."""
+        nodes = [
+            SpeakerNode(speaker_id=f"speaker{i}", name=f"Speaker {i}") for i in range(3)
+        ]
+        nodes.append(
+            ConversationNode(
+                conversation_id="conv-1",
+                audio_file_id="audio-1",
+                duration=10.0,
+                language="en",
+            )
+        )
+
+        created = await batch_service.create_nodes_batch(nodes)
+
+        assert created == 4
+        # One batch per label, each written concurrently
+        calls = batch_manager.execute_batch_transactions.call_args_list
+        assert len(calls) == 2
+        queries = [query for call in calls for query in call.args[0]]
+        # Three speakers in chunks of two, plus one conversation batch
+        assert len(queries) == 3
+        assert all(
+            query.startswith("UNWIND range(0, size($ids)") for query, _ in queries
+        )
+        assert [len(params["ids"]) for _, params in queries] == [2, 1, 1]
+        assert [len(params["props"]) for _, params in queries] == [2, 1, 1]
+        assert queries[0][1]["ids"] == ["speaker0", "speaker1"]
+
+    @pytest.mark.asyncio
+    async def test_create_relationships_batch_uses_unwind_per_type(
+        self, batch_service, batch_manager
+    ):
+        """Relationships are grouped by type into UNWIND statements."""
+        relationships = [
+            SpeaksInRelationship(
+                speaker_id=f"speaker{i}",
+                conversation_id="conv-1",
+                speaking_time=1.0,
+                turn_count=1,
+            )
+            for i in range(2)
+        ]
+
+        created = await batch_service.create_relationships_batch(relationships)
+
+        assert created == 2
+        queries = batch_manager.execute_batch_transactions.call_args.args[0]
+        assert len(queries) == 1
+        query, params = queries[0]
+        assert query.startswith("UNWIND range(0, size($from_ids)")
+        assert "SPEAKS_IN" in query
+        # Labelled endpoints let the MATCH use the per-label id indexes
+        assert "MATCH (a:Speaker {id: from_id}), (b:Conversation {id: to_id})" in query
+        assert params["from_ids"] == ["speaker0", "speaker1"]
+        assert params["to_ids"] == ["conv-1", "conv-1"]
+        assert len(params["props"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_create_relationships_batch_splits_by_endpoint_labels(
+        self, batch_service, batch_manager
+    ):
+        """Rows of one type with different endpoint labels get separate batches."""
+        relationships = [
+            GraphRelationship(
+                from_node_id="conv-1",
+                to_node_id="segment-1",
+                relationship_type=RelationshipType.CONTAINS,
+                properties={},
+                created_at=datetime.utcnow(),
+                from_node_type=NodeType.CONVERSATION,
+                to_node_type=NodeType.TRANSCRIPT_SEGMENT,
+            ),
+            GraphRelationship(
+                from_node_id="node-a",
+                to_node_id="node-b",
+                relationship_type=RelationshipType.CONTAINS,
+                properties={},
+                created_at=datetime.utcnow(),
+            ),
+        ]
+
+        await batch_service.create_relationships_batch(relationships)
+
+        queries = batch_manager.execute_batch_transactions.call_args.args[0]
+        assert [params["from_ids"] for _, params in queries] == [["conv-1"], ["node-a"]]
+        labelled_query, unlabelled_query = (query for query, _ in queries)
+        assert "(a:Conversation {id: from_id}), (b:TranscriptSegment {id: to_id})" in (
+            labelled_query
+        )
+        # Without endpoint types the match stays unlabelled
+        assert "MATCH (a {id: from_id}), (b {id: to_id})" in unlabelled_query
+
+
+class TestGraphServiceQueries:
+    """Test the Cypher queries GraphService sends."""
+
+    @pytest.fixture
+    def read_manager(self):
+        """Mock graph database manager that records read transactions."""
+        manager = MagicMock()
+        manager.is_connected = True
+        manager.execute_read_transaction = AsyncMock(return_value=[])
+        with patch(
+            "app.services.graph_service.get_graph_db_manager",
+            AsyncMock(return_value=manager),
+        ):
+            yield manager
+
+    @pytest.fixture
+    def read_service(self, read_manager):
+        """GraphService with graph enabled."""
+        with patch("app.services.graph_service.get_settings") as mock_settings:
+            mock_settings.return_value.graph.enabled = True
+            yield GraphService()
+
+    @pytest.mark.asyncio
+    async def test_get_database_stats_single_round_trip(
+        self, read_service, read_manager
+    ):
+        """Node and relationship counts come back from one query."""
+        read_manager.execute_read_transaction.return_value = [
+            {"nodes": 10, "relationships": 4}
+        ]
+        read_service.settings.graph.database.type = "neo4j"
+
+        stats = await read_service.get_database_stats()
+
+        read_manager.execute_read_transaction.assert_awaited_once()
+        assert stats["nodes"] == 10
+        assert stats["relationships"] == 4
+        assert stats["enabled"] is True
+
+    @pytest.mark.asyncio
+    async def test_get_speaker_network_streams_records(
+        self, read_service, read_manager
+    ):
+        """Speaker network rows are built while records are streamed."""
+        records = [
+            {
+                "speaker_id": "s1",
+                "speaker_name": "Alice",
+                "speaking_time": 12.5,
+                "interactions": [{"target_id": "s2"}, {"target_id": None}],
+            },
+            {"speaker_id": "s2", "speaker_name": "Bob", "interactions": []},
+        ]
+
+        async def stream(query, parameters):
+            for record in records:
+                yield record
+
+        read_manager.stream_read_transaction = MagicMock(side_effect=stream)
+
+        network = await read_service.get_speaker_network("conv-1")
+
+        read_manager.stream_read_transaction.assert_called_once()
+        read_manager.execute_read_transaction.assert_not_called()
+        assert [row["speaker_id"] for row in network] == ["s1", "s2"]
+        assert network[0]["interaction_count"] == 1
+        assert network[1]["speaking_time"] == 0
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_creates_node_id_indexes(
+        self, read_service, read_manager
+    ):
+        """Each node label gets an idempotent id index."""
+        read_manager.execute_write_transaction = AsyncMock(return_value=[])
+        read_service.settings.graph.database.type = "neo4j"
+
+        await read_service.ensure_indexes()
+
+        queries = [
+            call.args[0]
+            for call in read_manager.execute_write_transaction.call_args_list
+        ]
+        assert len(queries) == 5
+        assert all("CREATE INDEX" in q and "IF NOT EXISTS" in q for q in queries)
+        assert any("FOR (n:Speaker) ON (n.id)" in q for q in queries)
+
+    @pytest.mark.asyncio
+    async def test_node_relationships_query_text_is_stable(
+        self, read_service, read_manager
+    ):
+        """Relationship type filters are parameters, not part of the query."""
+        await read_service.get_node_relationships("n1", ["SPEAKS_IN"], "OUTGOING")
+        await read_service.get_node_relationships("n1", ["MENTIONS"], "OUTGOING")
+        await read_service.get_node_relationships("n1")
+
+        calls = read_manager.execute_read_transaction.call_args_list
+        assert calls[0].args[0] is calls[1].args[0]
+        assert "-[r]->" in calls[0].args[0]
+        assert calls[1].args[1]["relationship_types"] == ["MENTIONS"]
+        assert "-[r]-(" in calls[2].args[0]
+        assert calls[2].args[1]["relationship_types"] is None
+
+
+class TestGraphDatabaseManager:
+    """Test graph database driver lifecycle and batch execution."""
+
+    @pytest.fixture
+    def manager(self):
+        """Manager with graph enabled and the driver factory mocked."""
+        with patch("app.db.graph_session.get_settings") as mock_settings:
+            mock_settings.return_value.graph.enabled = True
+            manager = GraphDatabaseManager()
+        driver = MagicMock()
+        driver.connect = AsyncMock()
+        with patch.object(manager, "_create_driver", return_value=driver) as factory:
+            yield manager, factory
+
+    @pytest.mark.asyncio
+    async def test_initialize_creates_driver_once(self, manager):
+        """Concurrent and repeated initialize calls share a single driver."""
+        manager, factory = manager
+
+        await asyncio.gather(manager.initialize(), manager.initialize())
+        await manager.initialize()
+
+        assert manager.is_connected
+        factory.assert_called_once()
+        factory.return_value.connect.assert_awaited_once()
+
+    def test_create_driver_passes_pool_settings(self):
+        """Pool settings from configuration reach the Neo4j driver."""
+        with patch("app.db.graph_session.get_settings") as mock_settings:
+            database = mock_settings.return_value.graph.database
+            database.type = "neo4j"
+            database.max_connection_lifetime = 600
+            database.max_connection_pool_size = 100
+            database.connection_acquisition_timeout = 15
+            driver = GraphDatabaseManager()._create_driver()
+
+        assert isinstance(driver, Neo4jDriver)
+        assert driver.max_connection_lifetime == 600
+        assert driver.max_connection_pool_size == 100
+        assert driver.connection_acquisition_timeout == 15
+
+    @pytest.mark.asyncio
+    async def test_neo4j_connect_configures_pool(self):
+        """The async driver is constructed with the configured pool limits."""
+        driver = Neo4jDriver(
+            url="bolt://localhost:7687",
+            username="neo4j",
+            password="password",
+            max_connection_pool_size=100,
+            connection_acquisition_timeout=15,
+        )
+
+        with patch("neo4j.AsyncGraphDatabase.driver") as mock_driver:
+            await driver.connect()
+
+        kwargs = mock_driver.call_args.kwargs
+        assert kwargs["max_connection_pool_size"] == 100
+        assert kwargs["connection_acquisition_timeout"] == 15
+        assert kwargs["max_connection_lifetime"] == 1800
+
+    @pytest.fixture
+    def neo4j_tx(self):
+        """Mock Neo4j managed transaction run from a mocked driver session."""
+        result = MagicMock()
+        result.__aiter__.return_value = [{"id": "n1"}]
+        tx = MagicMock()
+        tx.run = AsyncMock(return_value=result)
+
+        async def run_managed(work, *args):
+            return await work(tx, *args)
+
+        session = MagicMock()
+        session.execute_read = AsyncMock(side_effect=run_managed)
+        session.execute_write = AsyncMock(side_effect=run_managed)
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=False)
+        driver = Neo4jDriver("bolt://localhost:7687", "neo4j", "password")
+        driver._driver = MagicMock()
+        driver._driver.session.return_value = session
+        return driver, session, tx
+
+    @pytest.mark.asyncio
+    async def test_queries_use_managed_transactions(self, neo4j_tx):
+        """Reads and writes go through the driver's retrying transaction functions."""
+        driver, session, tx = neo4j_tx
+
+        assert await driver.execute_read_query("MATCH (n) RETURN n") == [{"id": "n1"}]
+        await driver.execute_write_query("CREATE (n)", {"id": "n1"})
+
+        session.execute_read.assert_awaited_once()
+        session.execute_write.assert_awaited_once()
+        tx.run.assert_awaited_with("CREATE (n)", {"id": "n1"})
+
+    @pytest.mark.asyncio
+    async def test_read_queries_share_one_transaction(self, neo4j_tx):
+        """Several reads run on one managed read transaction, results kept apart."""
+        driver, session, tx = neo4j_tx
+        queries = [("MATCH (n) RETURN n", None), ("MATCH (n) RETURN n.id", {})]
+
+        results = await driver.execute_read_queries(queries)
+
+        session.execute_read.assert_awaited_once()
+        driver._driver.session.assert_called_once()
+        assert results == [[{"id": "n1"}], [{"id": "n1"}]]
+
+    @pytest.mark.asyncio
+    async def test_batch_queries_share_one_transaction(self, neo4j_tx):
+        """All batch queries run on a single managed write transaction."""
+        driver, session, tx = neo4j_tx
+        queries = [("UNWIND $rows AS row MERGE (n:Speaker {id: row.id})", {})] * 3
+
+        results = await driver.execute_batch_queries(queries)
+
+        session.execute_write.assert_awaited_once()
+        assert tx.run.await_count == 3
+        assert len(results) == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_retry_does_not_duplicate_results(self, neo4j_tx):
+        """A transaction retried after a transient error starts from scratch."""
+        driver, session, tx = neo4j_tx
+        tx.run.side_effect = [
+            tx.run.return_value,
+            TransientError("deadlock"),
+            tx.run.return_value,
+            tx.run.return_value,
+        ]
+
+        async def retry_once(work):
+            try:
+                return await work(tx)
+            except TransientError:
+                return await work(tx)
+
+        session.execute_write.side_effect = retry_once
+
+        results = await driver.execute_batch_queries([("Q1", {}), ("Q2", {})])
+
+        assert tx.run.await_count == 4
+        assert results == [{"id": "n1"}, {"id": "n1"}]
+
+    @pytest.mark.asyncio
+    async def test_batch_query_failure_aborts_transaction(self, neo4j_tx):
+        """A failing query propagates so the transaction is rolled back."""
+        driver, _, tx = neo4j_tx
+        tx.run.side_effect = [tx.run.return_value, RuntimeError("constraint")]
+
+        with pytest.raises(RuntimeError, match="constraint"):
+            await driver.execute_batch_queries([("Q1", {}), ("Q2", {}), ("Q3", {})])
+
+        assert tx.run.await_count == 2
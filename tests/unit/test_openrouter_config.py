@@ -0,0 +1,87 @@
+"""Unit tests for OpenRouter LLM graph configuration (no API calls)."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.config.settings import GraphSettings
+from app.core import graph_processor, llm_graph_processors
+from app.core.llm_graph_processors import LLMGraphProcessorFactory, OpenRouterProvider
+
+OPENROUTER_GRAPH_CONFIG = {
+    "GRAPH_ENABLED": True,
+    "GRAPH_LLM_PROVIDER": "openrouter",
+    "GRAPH_LLM_MODEL": "openai/gpt-3.5-turbo",
+    "GRAPH_LLM_API_KEY": "sk-or-v1-test-key",
+    "GRAPH_ENTITY_EXTRACTION_METHOD": "llm_based",
+    "GRAPH_TOPIC_EXTRACTION_METHOD": "llm_based",
+    "GRAPH_SENTIMENT_ANALYSIS_ENABLED": True,
+    "GRAPH_RELATIONSHIP_EXTRACTION_METHOD": "llm_based",
+}
+
+
+@pytest.fixture(scope="session")
+def openrouter_settings():
+    """Settings with every graph extractor routed to OpenRouter, built once."""
+    return SimpleNamespace(graph=GraphSettings(**OPENROUTER_GRAPH_CONFIG))
+
+
+def test_openrouter_configuration(openrouter_settings):
+    """Graph settings resolve to the OpenRouter provider and model."""
+    graph = openrouter_settings.graph
+
+    assert graph.enabled is True
+    assert graph.llm_provider == "openrouter"
+    assert graph.llm_model == "openai/gpt-3.5-turbo"
+    assert graph.llm_api_key.startswith("sk-or-")
+
+
+def test_create_llm_provider(openrouter_settings):
+    """The factory builds an OpenRouter provider without contacting the API."""
+    provider = LLMGraphProcessorFactory.create_llm_provider(openrouter_settings)
+
+    assert isinstance(provider, OpenRouterProvider)
+    assert provider.model == "openai/gpt-3.5-turbo"
+    assert provider.api_base == "https://openrouter.ai/api/v1"
+
+
+def test_create_llm_provider_requires_api_key(monkeypatch):
+    """Without a key in settings or environment the factory refuses to build."""
+    monkeypatch.delenv("GRAPH_LLM_API_KEY", raising=False)
+    monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+    config = {**OPENROUTER_GRAPH_CONFIG, "GRAPH_LLM_API_KEY": ""}
+    settings = SimpleNamespace(graph=GraphSettings(**config))
+
+    with pytest.raises(ValueError, match="API key is required"):
+        LLMGraphProcessorFactory.create_llm_provider(settings)
+
+
+@pytest.mark.parametrize(
+    "factory, expected",
+    [
+        ("create_entity_extractor", "LLMBasedEntityExtractor"),
+        ("create_topic_modeler", "LLMBasedTopicModeler"),
+        ("create_sentiment_analyzer", "LLMBasedSentimentAnalyzer"),
+        ("create_relationship_extractor", "LLMBasedRelationshipExtractor"),
+    ],
+)
+def test_component_factories(openrouter_settings, factory, expected):
+    """Each component factory wraps an OpenRouter provider."""
+    component = getattr(LLMGraphProcessorFactory, factory)(openrouter_settings)
+
+    assert isinstance(component, getattr(llm_graph_processors, expected))
+    assert isinstance(component.llm_provider, OpenRouterProvider)
+
+
+def test_graph_processor_configures_llm_extractors(openrouter_settings):
+    """GraphProcessor wires up all LLM extractors when they are selected."""
+    with patch.object(
+        graph_processor, "get_settings", return_value=openrouter_settings
+    ):
+        processor = graph_processor.GraphProcessor()
+
+    assert processor.llm_entity_extractor is not None
+    assert processor.llm_topic_modeler is not None
+    assert processor.llm_sentiment_analyzer is not None
+    assert processor.llm_relationship_extractor is not None
@@ -3,8 +3,10 @@ Unit tests for the application services.
 """
 
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import msgpack
+import orjson
 import pytest
 
 from app.core.job_queue import JobQueue
@@ -94,9 +96,8 @@ async def test_translation_service_translate_text():
 
         service = TranslationService()
 
-        # Mock the pipeline to return a translation
-        mock_pipeline = MagicMock()
-        mock_pipeline.return_value = [{"translation_text": "Hola"}]
+        # Mock the pipeline to return a translation; no magic methods are needed
+        mock_pipeline = Mock(return_value=[{"translation_text": "Hola"}])
         service.pipeline = mock_pipeline
 
         text = "Hello"
@@ -126,9 +127,9 @@ async def test_summarization_service_summarize_text():
             # Mock the async context manager and response
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = {
-                "choices": [{"message": {"content": expected_summary}}]
-            }
+            mock_response.content = orjson.dumps(
+                {"choices": [{"message": {"content": expected_summary}}]}
+            )
 
             mock_client.return_value.__aenter__.return_value.post = AsyncMock(
                 return_value=mock_response
@@ -148,15 +149,37 @@ async def test_cache_service_set_get_delete():
 
         service = CacheService()
         key = "test_key"
-        value = "test_value"
+        value = {"status": "completed", "segments": [1, 2]}
+        packed = msgpack.packb(value, use_bin_type=True)
 
         await service.set(key, value)
-        mock_redis_client.set.assert_called_once_with(key, value, ex=3600)
+        mock_redis_client.set.assert_called_once_with(key, packed, ex=3600)
 
-        mock_redis_client.get.return_value = value
+        mock_redis_client.get.return_value = packed
         retrieved_value = await service.get(key)
         mock_redis_client.get.assert_called_once_with(key)
         assert retrieved_value == value
 
         await service.delete(key)
         mock_redis_client.delete.assert_called_once_with(key)
+
+
+@pytest.mark.asyncio
+async def test_cache_service_set_many_uses_one_pipeline():
+    """Test CacheService.set_many queues every key on a single pipeline."""
+    with patch("app.services.cache.redis.from_url") as mock_from_url:
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock()
+        mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
+        mock_pipe.__aexit__ = AsyncMock(return_value=False)
+        mock_redis_client = MagicMock()
+        mock_redis_client.pipeline.return_value = mock_pipe
+        mock_from_url.return_value = mock_redis_client
+
+        service = CacheService()
+        await service.set_many({"a": 1, "b": "two"}, expire=60)
+
+        mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+        assert mock_pipe.set.call_count == 2
+        mock_pipe.set.assert_any_call("b", msgpack.packb("two"), ex=60)
+        mock_pipe.execute.assert_awaited_once()
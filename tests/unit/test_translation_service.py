@@ -8,30 +8,60 @@ import pytest
 
 from app.services.translation import TranslationService
 
+# Build the module-scoped fixtures once under --dist loadgroup (see tests/TESTING.md)
+pytestmark = pytest.mark.xdist_group(name="translation_service")
+
 
 class TestTranslationService:
     """Test cases for TranslationService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_settings(self):
-        """Mock settings for testing."""
+        """Mock settings for testing, shared because tests only read them."""
         settings = Mock()
         settings.translation.enabled = True
         settings.translation.model_name = "Helsinki-NLP/opus-mt-en-es"
         settings.translation.device = "cpu"
+        settings.translation.max_length = 512
         return settings
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_disabled_settings(self):
         """Mock settings with translation disabled."""
         settings = Mock()
         settings.translation.enabled = False
         return settings
 
-    @patch("app.services.translation.get_settings")
-    def test_init_enabled(self, mock_get_settings, mock_settings):
+    @pytest.fixture(scope="class", autouse=True)
+    def mock_get_settings(self, mock_settings):
+        """Patch get_settings once for the whole class with the enabled settings."""
+        with patch(
+            "app.services.translation.get_settings", return_value=mock_settings
+        ) as mock_get_settings:
+            yield mock_get_settings
+
+    @pytest.fixture
+    def disabled_settings(self, mock_get_settings, mock_disabled_settings, monkeypatch):
+        """Serve the disabled settings from get_settings for a single test."""
+        monkeypatch.setattr(mock_get_settings, "return_value", mock_disabled_settings)
+
+    @pytest.fixture
+    def make_service(self):
+        """Factory for a service whose pipeline returns, or raises, a given response."""
+
+        def _make(response):
+            service = TranslationService()
+            service.pipeline = Mock()
+            if isinstance(response, Exception):
+                service.pipeline.side_effect = response
+            else:
+                service.pipeline.return_value = response
+            return service
+
+        return _make
+
+    def test_init_enabled(self):
         """Test TranslationService initialization when enabled."""
-        mock_get_settings.return_value = mock_settings
 
         service = TranslationService()
 
@@ -39,23 +69,18 @@ class TestTranslationService:
         assert service.model_name == "Helsinki-NLP/opus-mt-en-es"
         assert service.device == -1  # CPU device
 
-    @patch("app.services.translation.get_settings")
-    def test_init_disabled(self, mock_get_settings, mock_disabled_settings):
+    @pytest.mark.usefixtures("disabled_settings")
+    def test_init_disabled(self):
         """Test TranslationService initialization when disabled."""
-        mock_get_settings.return_value = mock_disabled_settings
 
         service = TranslationService()
 
         assert service.pipeline is None
 
-    @patch("app.services.translation.get_settings")
     @patch("app.services.translation.torch")
     @pytest.mark.asyncio
-    async def test_initialize_model_success(
-        self, mock_torch, mock_get_settings, mock_settings
-    ):
+    async def test_initialize_model_success(self, mock_torch):
         """Test successful model initialization."""
-        mock_get_settings.return_value = mock_settings
         mock_torch.cuda.is_available.return_value = False
 
         # Mock the transformers pipeline import more directly
@@ -72,26 +97,19 @@ class TestTranslationService:
                 "translation", model="Helsinki-NLP/opus-mt-en-es", device=-1
             )
 
-    @patch("app.services.translation.get_settings")
+    @pytest.mark.usefixtures("disabled_settings")
     @pytest.mark.asyncio
-    async def test_initialize_model_disabled(
-        self, mock_get_settings, mock_disabled_settings
-    ):
+    async def test_initialize_model_disabled(self):
         """Test model initialization when translation is disabled."""
-        mock_get_settings.return_value = mock_disabled_settings
 
         service = TranslationService()
         await service.initialize_model()
 
         assert service.pipeline is None
 
-    @patch("app.services.translation.get_settings")
     @pytest.mark.asyncio
-    async def test_initialize_model_import_error(
-        self, mock_get_settings, mock_settings
-    ):
+    async def test_initialize_model_import_error(self):
         """Test model initialization with import error."""
-        mock_get_settings.return_value = mock_settings
 
         with patch(
             "transformers.pipelines.pipeline",
@@ -102,11 +120,9 @@ class TestTranslationService:
 
             assert service.pipeline is None
 
-    @patch("app.services.translation.get_settings")
     @pytest.mark.asyncio
-    async def test_translate_text_no_pipeline(self, mock_get_settings, mock_settings):
+    async def test_translate_text_no_pipeline(self):
         """Test translation when pipeline is not available."""
-        mock_get_settings.return_value = mock_settings
 
         service = TranslationService()
         # Don't initialize the pipeline
@@ -115,127 +131,52 @@ class TestTranslationService:
 
         assert result == "Hello"  # Should return original text
 
-    @patch("app.services.translation.get_settings")
+    @pytest.mark.parametrize(
+        "response, source_language, expected",
+        [
+            pytest.param(
+                [{"translation_text": "Hola"}], None, "Hola", id="list_format"
+            ),
+            pytest.param({"translation_text": "Hola"}, None, "Hola", id="dict_format"),
+            pytest.param(
+                {"invalid_key": "some_value"}, None, "Hello", id="invalid_format"
+            ),
+            pytest.param(Exception("Pipeline error"), None, "Hello", id="exception"),
+            pytest.param(
+                [{"translation_text": "Hola"}], "en", "Hola", id="source_language"
+            ),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_translate_text_success_list_format(
-        self, mock_get_settings, mock_settings
+    async def test_translate_text_response(
+        self, make_service, response, source_language, expected
     ):
-        """Test successful translation with list format response."""
-        mock_get_settings.return_value = mock_settings
+        """Test translation across pipeline responses, failures and source languages."""
+        service = make_service(response)
 
-        # Mock pipeline response
-        mock_pipeline = Mock()
-        mock_pipeline.return_value = [{"translation_text": "Hola"}]
+        result = await service.translate_text("Hello", "es", source_language)
 
-        service = TranslationService()
-        service.pipeline = mock_pipeline
-
-        result = await service.translate_text("Hello", "es")
-
-        assert result == "Hola"
-        mock_pipeline.assert_called_once_with("Hello", max_length=512)
+        # Unusable responses and errors fall back to the original text
+        assert result == expected
+        service.pipeline.assert_called_once_with("Hello", max_length=512)
 
-    @patch("app.services.translation.get_settings")
     @pytest.mark.asyncio
-    async def test_translate_text_success_dict_format(
-        self, mock_get_settings, mock_settings
-    ):
-        """Test successful translation with dict format response."""
-        mock_get_settings.return_value = mock_settings
-
-        # Mock pipeline response
-        mock_pipeline = Mock()
-        mock_pipeline.return_value = {"translation_text": "Hola"}
-
-        service = TranslationService()
-        service.pipeline = mock_pipeline
-
-        result = await service.translate_text("Hello", "es")
-
-        assert result == "Hola"
-
-    @patch("app.services.translation.get_settings")
-    @pytest.mark.asyncio
-    async def test_translate_text_invalid_format(
-        self, mock_get_settings, mock_settings
-    ):
-        """Test translation with invalid response format."""
-        mock_get_settings.return_value = mock_settings
-
-        # Mock pipeline response with invalid format
-        mock_pipeline = Mock()
-        mock_pipeline.return_value = {"invalid_key": "some_value"}
-
-        service = TranslationService()
-        service.pipeline = mock_pipeline
-
-        result = await service.translate_text("Hello", "es")
-
-        assert result == "Hello"  # Should return original text
-
-    @patch("app.services.translation.get_settings")
-    @pytest.mark.asyncio
-    async def test_translate_text_exception(self, mock_get_settings, mock_settings):
-        """Test translation when pipeline raises an exception."""
-        mock_get_settings.return_value = mock_settings
-
-        # Mock pipeline that raises an exception
-        mock_pipeline = Mock()
-        mock_pipeline.side_effect = Exception("Pipeline error")
-
-        service = TranslationService()
-        service.pipeline = mock_pipeline
-
-        result = await service.translate_text("Hello", "es")
-
-        assert result == "Hello"  # Should return original text
-
-    @patch("app.services.translation.get_settings")
-    @pytest.mark.asyncio
-    async def test_translate_text_with_source_language(
-        self, mock_get_settings, mock_settings
-    ):
-        """Test translation with source language specified."""
-        mock_get_settings.return_value = mock_settings
-
-        # Mock pipeline response
-        mock_pipeline = Mock()
-        mock_pipeline.return_value = [{"translation_text": "Hola"}]
-
-        service = TranslationService()
-        service.pipeline = mock_pipeline
-
-        result = await service.translate_text("Hello", "es", "en")
-
-        assert result == "Hola"
-        mock_pipeline.assert_called_once_with("Hello", max_length=512)
-
-    @patch("app.services.translation.get_settings")
-    @pytest.mark.asyncio
-    async def test_translate_long_text(self, mock_get_settings, mock_settings):
+    async def test_translate_long_text(self, make_service):
         """Test translation with longer text."""
-        mock_get_settings.return_value = mock_settings
-
         long_text = "This is a very long text that we want to translate. " * 20
-
-        # Mock pipeline response
-        mock_pipeline = Mock()
-        mock_pipeline.return_value = [{"translation_text": "Texto traducido muy largo"}]
-
-        service = TranslationService()
-        service.pipeline = mock_pipeline
+        service = make_service([{"translation_text": "Texto traducido muy largo"}])
 
         result = await service.translate_text(long_text, "es")
 
         assert result == "Texto traducido muy largo"
-        mock_pipeline.assert_called_once_with(long_text, max_length=512)
+        service.pipeline.assert_called_once_with(long_text, max_length=512)
 
 
-@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.skip(reason="Integration test requires actual model download")
 async def test_translation_service_integration():
     """Integration test for the translation service (requires actual model)."""
-    # This test is skipped by default as it requires actual model download
-    pytest.skip("Integration test requires actual model download")
+    # Skipped at collection time so no event loop is set up for it
 
     # Uncomment to run actual integration test:
     # import os
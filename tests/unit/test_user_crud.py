@@ -2,263 +2,210 @@
 Unit tests for User CRUD operations.
 """
 
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import MagicMock, Mock
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.api.dependencies import CurrentUser
+from app.db.base import Base
 from app.db.crud.user import CRUDUser
+from app.schemas.api import UserCreateRequest, UserUpdateRequest
 from app.schemas.database import User
 
+# Tests share the module's in-memory database, so they share its event loop too
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Inputs for the parametrized create tests; pydantic models, so built once
+TOKEN_USER = CurrentUser(
+    user_id="auth0|507f1f77bcf86cd799439011",
+    username="John Doe",
+    email="john.doe@example.com",
+    roles=["user"],
+    claims={},
+)
+MINIMAL_TOKEN_USER = CurrentUser(
+    user_id="auth0|minimal",
+    username="Minimal User",
+    email="minimal@example.com",
+    roles=[],
+    claims={},
+)
+PASSWORD_USER = UserCreateRequest(
+    email="regular@example.com",
+    password="securepassword123",
+    full_name="Regular User",
+)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def engine():
+    """In-memory SQLite engine with the schema created once per module."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+
+    # Let SQLAlchemy own transactions so per-test SAVEPOINTs really roll back
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
 
 class TestUserCRUD:
     """Test suite for User CRUD operations."""
 
-    @pytest.fixture
-    def db_session(self):
-        """Mock database session."""
-        return Mock(spec=AsyncSession)
+    @pytest_asyncio.fixture(loop_scope="module")
+    async def db_session(self, engine):
+        """Session whose commits become savepoints, rolled back after each test."""
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            session = AsyncSession(
+                bind=conn,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            yield session
+            await session.close()
+            await transaction.rollback()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def user_crud(self):
-        """User CRUD instance."""
+        """User CRUD instance, shared because it only holds the model class."""
         return CRUDUser(User)
 
-    @pytest.fixture
-    def token_user_data(self):
-        """Mock user data from JWT token."""
-        return CurrentUser(
-            user_id="auth0|507f1f77bcf86cd799439011",
-            username="John Doe",
-            email="john.doe@example.com",
-            roles=["user"],
-            claims={},
-        )
+    @pytest_asyncio.fixture(loop_scope="module")
+    async def existing_user(self, db_session):
+        """A stored user to look up and update."""
+        user = User(email="existing@example.com", full_name="Old Name", is_active=True)
+        db_session.add(user)
+        await db_session.flush()
+        return user
 
-    @pytest.mark.asyncio
-    async def test_get_by_email_found(self, user_crud, db_session):
+    async def test_get_by_email_found(self, user_crud, db_session, existing_user):
         """Test getting a user by email when user exists."""
 
-        # Mock user object
-        mock_user = Mock()
-        mock_user.id = 1
-        mock_user.email = "test@example.com"
-        mock_user.full_name = "Test User"
-        mock_user.is_active = True
-        mock_user.hashed_password = None
-
-        # Mock database query result
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = mock_user
-        db_session.execute = AsyncMock(return_value=mock_result)
-
-        result = await user_crud.get_by_email(db_session, email="test@example.com")
+        result = await user_crud.get_by_email(db_session, email="existing@example.com")
 
-        assert result == mock_user
-        db_session.execute.assert_called_once()
+        assert result is existing_user
 
-    @pytest.mark.asyncio
     async def test_get_by_email_not_found(self, user_crud, db_session):
         """Test getting a user by email when user doesn't exist."""
 
-        # Mock database query result
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        db_session.execute = AsyncMock(return_value=mock_result)
-
         result = await user_crud.get_by_email(
             db_session, email="nonexistent@example.com"
         )
 
         assert result is None
-        db_session.execute.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_create_from_token_success(
-        self, user_crud, db_session, token_user_data
-    ):
-        """Test creating a user from JWT token data."""
-
-        # Mock database operations
-        db_session.add = Mock()
-        db_session.commit = AsyncMock()
-        db_session.refresh = AsyncMock()
-
-        # Mock the created user object
-        mock_user = Mock()
-        mock_user.email = token_user_data.email
-        mock_user.full_name = token_user_data.username
-        mock_user.is_active = True
-        mock_user.hashed_password = None
-
-        # Patch User constructor to return our mock
-        with patch.object(User, "__new__", return_value=mock_user):
-            result = await user_crud.create_from_token(
-                db_session, token_data=token_user_data
-            )
-
-        # Verify the user was created with correct data
-        assert result.email == token_user_data.email
-        assert result.full_name == token_user_data.username
-        assert result.is_active is True
-        assert result.hashed_password is None
-
-        # Verify database operations were called
-        db_session.add.assert_called_once()
-        db_session.commit.assert_called_once()
-        db_session.refresh.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_create_from_token_with_minimal_data(self, user_crud, db_session):
-        """Test creating a user from JWT token with minimal data."""
-
-        minimal_token_data = CurrentUser(
-            user_id="auth0|minimal",
-            username="Minimal User",
-            email="minimal@example.com",
-            roles=[],
-            claims={},
-        )
-
-        # Mock database operations
-        db_session.add = Mock()
-        db_session.commit = AsyncMock()
-        db_session.refresh = AsyncMock()
-
-        # Mock the created user object
-        mock_user = Mock()
-        mock_user.email = minimal_token_data.email
-        mock_user.full_name = minimal_token_data.username
-        mock_user.is_active = True
-        mock_user.hashed_password = None
-
-        # Patch User constructor to return our mock
-        with patch.object(User, "__new__", return_value=mock_user):
-            result = await user_crud.create_from_token(
-                db_session, token_data=minimal_token_data
-            )
-
-        # Verify the user was created with minimal data
-        assert result.email == minimal_token_data.email
-        assert result.full_name == minimal_token_data.username
-        assert result.is_active is True
-
-        # Verify database operations were called
-        db_session.add.assert_called_once()
-        db_session.commit.assert_called_once()
-        db_session.refresh.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_update_user_success(self, user_crud, db_session):
+    async def test_update_user_success(self, user_crud, db_session, existing_user):
         """Test updating an existing user."""
 
-        # Mock existing user
-        existing_user = Mock()
-        existing_user.id = 1
-        existing_user.email = "existing@example.com"
-        existing_user.full_name = "Old Name"
-        existing_user.is_active = True
-        existing_user.hashed_password = None
-
-        # Mock update data
         update_data = {"full_name": "New Name", "is_active": False}
 
-        # Mock database operations
-        db_session.add = Mock()
-        db_session.commit = AsyncMock()
-        db_session.refresh = AsyncMock()
-
         result = await user_crud.update(
             db_session, db_obj=existing_user, obj_in=update_data
         )
 
         # Verify the user data was updated
+        assert result is existing_user
         assert existing_user.full_name == "New Name"
         assert existing_user.is_active is False
         assert existing_user.email == "existing@example.com"  # Should remain unchanged
 
-        # Verify database operations were called
-        db_session.add.assert_called_once_with(existing_user)
-        db_session.commit.assert_called_once()
-        db_session.refresh.assert_called_once_with(existing_user)
-
-    @pytest.mark.asyncio
-    async def test_update_user_with_schema_object(self, user_crud, db_session):
+    async def test_update_user_with_schema_object(
+        self, user_crud, db_session, existing_user
+    ):
         """Test updating a user with a Pydantic schema object."""
 
-        from app.schemas.api import UserUpdateRequest
-
-        # Mock existing user
-        existing_user = Mock()
-        existing_user.id = 1
-        existing_user.email = "existing@example.com"
-        existing_user.full_name = "Old Name"
-        existing_user.is_active = True
-        existing_user.hashed_password = None
-
-        # Create update schema object
         update_schema = UserUpdateRequest(
             full_name="Schema Updated Name", is_active=False
         )
 
-        # Mock database operations
-        db_session.add = Mock()
-        db_session.commit = AsyncMock()
-        db_session.refresh = AsyncMock()
-
         result = await user_crud.update(
             db_session, db_obj=existing_user, obj_in=update_schema
         )
 
         # Verify the user data was updated
+        assert result is existing_user
         assert existing_user.full_name == "Schema Updated Name"
         assert existing_user.is_active is False
 
-        # Verify database operations were called
-        db_session.add.assert_called_once_with(existing_user)
-        db_session.commit.assert_called_once()
-        db_session.refresh.assert_called_once_with(existing_user)
-
-    @pytest.mark.asyncio
-    async def test_create_regular_user_with_password(self, user_crud, db_session):
-        """Test creating a regular user with password (existing functionality)."""
+    async def test_update_user_ignores_unknown_fields(self, user_crud):
+        """Test that update skips keys the User model does not define."""
 
-        from app.schemas.api import UserCreateRequest
-
-        user_request = UserCreateRequest(
-            email="regular@example.com",
-            password="securepassword123",
-            full_name="Regular User",
+        # The spec makes hasattr() false for names User lacks, like a real row
+        user = Mock(
+            spec=User,
+            email="existing@example.com",
+            full_name="Old Name",
+            is_active=True,
+            hashed_password=None,
         )
 
-        hashed_password = "hashed_secure_password"
-
-        # Mock database operations
-        db_session.add = Mock()
-        db_session.commit = AsyncMock()
-        db_session.refresh = AsyncMock()
-
-        # Mock the created user object
-        mock_user = Mock()
-        mock_user.email = user_request.email
-        mock_user.full_name = user_request.full_name
-        mock_user.is_active = True
-        mock_user.hashed_password = hashed_password
-
-        # Patch User constructor to return our mock
-        with patch.object(User, "__new__", return_value=mock_user):
-            result = await user_crud.create(
-                db_session, obj_in=user_request, hashed_password=hashed_password
-            )
+        result = await user_crud.update(
+            MagicMock(spec=AsyncSession),
+            db_obj=user,
+            obj_in={"full_name": "New Name", "nickname": "ignored"},
+        )
 
-        # Verify the user was created with correct data
-        assert result.email == user_request.email
-        assert result.full_name == user_request.full_name
-        assert result.hashed_password == hashed_password
+        assert result is user
+        assert user.full_name == "New Name"
+        assert not hasattr(user, "nickname")
+
+    @pytest.mark.parametrize(
+        "method, kwargs, expected",
+        [
+            pytest.param(
+                "create_from_token",
+                {"token_data": TOKEN_USER},
+                {
+                    "email": TOKEN_USER.email,
+                    "full_name": TOKEN_USER.username,
+                    "hashed_password": None,
+                },
+                id="from_token",
+            ),
+            pytest.param(
+                "create_from_token",
+                {"token_data": MINIMAL_TOKEN_USER},
+                {
+                    "email": MINIMAL_TOKEN_USER.email,
+                    "full_name": MINIMAL_TOKEN_USER.username,
+                    "hashed_password": None,
+                },
+                id="from_token_minimal",
+            ),
+            pytest.param(
+                "create",
+                {
+                    "obj_in": PASSWORD_USER,
+                    "hashed_password": "hashed_secure_password",
+                },
+                {
+                    "email": PASSWORD_USER.email,
+                    "full_name": PASSWORD_USER.full_name,
+                    "hashed_password": "hashed_secure_password",
+                },
+                id="with_password",
+            ),
+        ],
+    )
+    async def test_create_user(self, user_crud, db_session, method, kwargs, expected):
+        """Test creating a user from JWT token data or a password signup."""
+
+        result = await getattr(user_crud, method)(db_session, **kwargs)
+
+        # Verify the user was stored with correct data
+        assert result.id is not None
+        assert {field: getattr(result, field) for field in expected} == expected
         assert result.is_active is True
-
-        # Verify database operations were called
-        db_session.add.assert_called_once()
-        db_session.commit.assert_called_once()
-        db_session.refresh.assert_called_once()
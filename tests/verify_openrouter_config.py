@@ -18,6 +18,23 @@ os.environ.setdefault("GRAPH_LLM_PROVIDER", "openrouter")
 os.environ.setdefault("GRAPH_LLM_MODEL", "openai/gpt-3.5-turbo")
 os.environ.setdefault("OPENROUTER_API_KEY", "sk-or-v1-test-key")  # Test key
 
+# Imported once, after the environment above so settings pick it up
+try:
+    from app.config.settings import get_settings
+    from app.core.graph_processor import GraphProcessor
+    from app.core.llm_graph_processors import LLMGraphProcessorFactory
+except ImportError as e:
+    print(f"❌ Failed to import application modules: {e}")
+    sys.exit(1)
+
+# Component factories probed by test_llm_factory, with their report labels
+FACTORY_PROBES = (
+    ("Entity extractor", LLMGraphProcessorFactory.create_entity_extractor),
+    ("Topic modeler", LLMGraphProcessorFactory.create_topic_modeler),
+    ("Sentiment analyzer", LLMGraphProcessorFactory.create_sentiment_analyzer),
+    ("Relationship extractor", LLMGraphProcessorFactory.create_relationship_extractor),
+)
+
 
 def test_configuration():
     """Test the OpenRouter configuration setup."""
@@ -25,8 +42,6 @@ def test_configuration():
     print("=" * 50)
 
     try:
-        from app.config.settings import get_settings
-
         settings = get_settings()
 
         print("✅ Settings loaded successfully")
@@ -41,7 +56,7 @@ def test_configuration():
         )
 
         # Test if API key is properly read
-        api_key = settings.graph.llm_api_key or os.getenv("OPENROUTER_API_KEY")
+        api_key = settings.graph.llm_api_key or os.environ.get("OPENROUTER_API_KEY")
         if api_key:
             print(f"✅ API key configured: {api_key[:8]}...")
         else:
@@ -60,9 +75,6 @@ def test_llm_factory():
     print("=" * 50)
 
     try:
-        from app.config.settings import get_settings
-        from app.core.llm_graph_processors import LLMGraphProcessorFactory
-
         settings = get_settings()
 
         # Test factory methods (without making API calls)
@@ -78,38 +90,13 @@ def test_llm_factory():
             else:
                 print(f"❌ Factory error: {e}")
 
-        # Test other factory methods
-        try:
-            entity_extractor = LLMGraphProcessorFactory.create_entity_extractor(
-                settings
-            )
-            print(f"✅ Entity extractor factory: {type(entity_extractor).__name__}")
-        except Exception as e:
-            print(f"⚠️  Entity extractor factory: {e}")
-
-        try:
-            topic_modeler = LLMGraphProcessorFactory.create_topic_modeler(settings)
-            print(f"✅ Topic modeler factory: {type(topic_modeler).__name__}")
-        except Exception as e:
-            print(f"⚠️  Topic modeler factory: {e}")
-
-        try:
-            sentiment_analyzer = LLMGraphProcessorFactory.create_sentiment_analyzer(
-                settings
-            )
-            print(f"✅ Sentiment analyzer factory: {type(sentiment_analyzer).__name__}")
-        except Exception as e:
-            print(f"⚠️  Sentiment analyzer factory: {e}")
-
-        try:
-            relationship_extractor = (
-                LLMGraphProcessorFactory.create_relationship_extractor(settings)
-            )
-            print(
-                f"✅ Relationship extractor factory: {type(relationship_extractor).__name__}"
-            )
-        except Exception as e:
-            print(f"⚠️  Relationship extractor factory: {e}")
+        # Test other factory methods; they only construct objects, so run in order
+        for label, factory in FACTORY_PROBES:
+            try:
+                component = factory(settings)
+                print(f"✅ {label} factory: {type(component).__name__}")
+            except Exception as e:
+                print(f"⚠️  {label} factory: {e}")
 
         return True
 
@@ -124,12 +111,7 @@ def test_graph_processor_integration():
     print("=" * 50)
 
     try:
-        from app.config.settings import get_settings
-        from app.core.graph_processor import GraphProcessor
-
-        settings = get_settings()
-
-        # Initialize graph processor
+        # Initialize graph processor (it reads the cached settings itself)
         processor = GraphProcessor()
 
         print("✅ Graph processor initialized")
@@ -192,9 +174,11 @@ def test_environment_variables():
         "GRAPH_LLM_TEMPERATURE",
     ]
 
+    env = os.environ
+
     print("Required variables:")
     for var in required_vars:
-        value = os.getenv(var)
+        value = env.get(var)
         if value:
             # Hide API key for security
             display_value = value if var != "OPENROUTER_API_KEY" else f"{value[:8]}..."
@@ -204,7 +188,7 @@ def test_environment_variables():
 
     print("\nOptional variables:")
     for var in optional_vars:
-        value = os.getenv(var)
+        value = env.get(var)
         if value:
             print(f"✅ {var}: {value}")
         else:
@@ -218,17 +202,21 @@ def main():
     print("🚀 OpenRouter Configuration Verification")
     print("=" * 50)
 
-    # Test configuration
+    # Test configuration (flush after each section so piped output keeps up)
     config_ok = test_configuration()
+    sys.stdout.flush()
 
     # Test environment variables
     env_ok = test_environment_variables()
+    sys.stdout.flush()
 
     # Test LLM factory
     factory_ok = test_llm_factory()
+    sys.stdout.flush()
 
     # Test graph processor integration
     processor_ok = test_graph_processor_integration()
+    sys.stdout.flush()
 
     print("\n📊 Test Summary")
     print("=" * 30)